@@ -2,16 +2,61 @@
 Agriculture Module API Endpoint
 """
 
-from fastapi import APIRouter, HTTPException
+import asyncio
+import os
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Optional
+from fastapi import APIRouter, HTTPException, Request
+from starlette.concurrency import run_in_threadpool
 from app.schemas.agriculture import AgricultureInput
 from app.schemas.common import OptimizationResponse, ErrorResponse
 from app.optimizers.agriculture import AgricultureOptimizer
 
 router = APIRouter(prefix="/agriculture", tags=["Agriculture"])
 
+# Solves run in the threadpool so they don't block the event loop; cap how
+# many run at once (defaults to one per CPU)
+MAX_CONCURRENT_SOLVES = int(os.getenv("MAX_CONCURRENT_SOLVES", os.cpu_count() or 1))
+_solve_slots = asyncio.Semaphore(MAX_CONCURRENT_SOLVES)
+
+# Recent optimal bases keyed by solution_id, for warm-starting parameter sweeps
+BASIS_CACHE_SIZE = 128
+BASIS_CACHE_TTL_SECONDS = 600
+_basis_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+
+def _store_basis(basis: Any) -> Optional[str]:
+    """Cache a solved basis and return its id (None if there is nothing to cache)."""
+    if basis is None:
+        return None
+    solution_id = uuid.uuid4().hex
+    _basis_cache[solution_id] = (time.monotonic(), basis)
+    while len(_basis_cache) > BASIS_CACHE_SIZE:
+        _basis_cache.popitem(last=False)
+    return solution_id
+
+
+def _lookup_basis(solution_id: Optional[str]) -> Any:
+    """Return a cached basis, or None if the id is unknown or expired."""
+    entry = _basis_cache.get(solution_id) if solution_id else None
+    if entry is None:
+        return None
+    stored_at, basis = entry
+    if time.monotonic() - stored_at > BASIS_CACHE_TTL_SECONDS:
+        del _basis_cache[solution_id]
+        return None
+    _basis_cache.move_to_end(solution_id)
+    return basis
+
 
 @router.post("/optimize", response_model=OptimizationResponse)
-async def optimize_agriculture(input_data: AgricultureInput):
+async def optimize_agriculture(
+    input_data: AgricultureInput,
+    request: Request,
+    warm_start_id: Optional[str] = None,
+):
     """
     Optimize agricultural production planning under weather uncertainty.
     
@@ -24,14 +69,19 @@ async def optimize_agriculture(input_data: AgricultureInput):
     - Expected profit
     - Scenario-specific decisions
     - Risk metrics
+    - A solution_id; pass it back as ?warm_start_id=... on a request with the
+      same crops/scenarios (e.g. a price sweep) to warm-start the solver
     """
     try:
-        # Convert Pydantic model to dict
-        data_dict = input_data.model_dump()
-        
-        # Initialize and solve optimizer
-        optimizer = AgricultureOptimizer(data_dict)
-        results = optimizer.solve()
+        # Initialize and solve optimizer straight from the validated model
+        optimizer = AgricultureOptimizer(
+            input_data,
+            persistent_solver=getattr(request.app.state, 'highs', None),
+        )
+        warm_start_from = _lookup_basis(warm_start_id)
+        async with _solve_slots:
+            results = await run_in_threadpool(optimizer.solve, warm_start_from=warm_start_from)
+        results['solution_id'] = _store_basis(optimizer.basis)
         
         return results
         
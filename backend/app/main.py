@@ -6,6 +6,7 @@ Main FastAPI Application
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api import agriculture
+from app.optimizers.base import HighsPool
 import os
 
 # Initialize FastAPI app
@@ -16,6 +17,8 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc"
 )
+# HiGHS sessions reused across optimization requests, one per concurrent solve
+app.state.highs = HighsPool()
 
 # CORS configuration
 # Set ALLOWED_ORIGINS env var to a comma-separated list of origins, or * to allow all.
@@ -0,0 +1,122 @@
+"""
+L-shaped (Benders) decomposition for the agriculture two-stage model.
+
+Master:      min  materials · acres + Σ_c θ_c
+             s.t. Σ acres <= total_land
+                  θ_c >= Σ_s p_s π_sc (requirement_c - yield_coef_sc acres_c)   (one cut per crop per iteration)
+
+Subproblem:  for fixed acres and scenario s, with deficit d = requirement - yield_coef_s ∘ acres
+             min  purchase_price · P - selling_price_own_store · S
+             s.t. P - S >= d,  P, S >= 0
+
+The subproblem separates per (scenario, crop) and has a closed-form solution:
+buy any shortfall, sell any surplus. All scenarios are therefore evaluated
+together with array operations; only the master is an LP, kept loaded in one
+HiGHS instance that re-solves from its previous basis as cuts are added.
+All costs here are minimization costs; the optimizer converts back to profit.
+"""
+
+from typing import Tuple
+import highspy
+import numpy as np
+
+
+def solve_recourse(
+    deficits: np.ndarray,
+    buy_price: np.ndarray,
+    sell_own: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Solve the subproblems of all scenarios at once.
+
+    Args:
+        deficits: [S, C] requirement minus production
+
+    Returns:
+        (recourse cost [S], duals π of the supply rows [S, C],
+         vendor purchases P [S, C], own-store sales S [S, C])
+    """
+    # Buying to resell at the own store would make every subproblem unbounded
+    if np.any(buy_price < sell_own):
+        raise RuntimeError("Optimization failed with status: Unbounded")
+
+    short = deficits > 0
+    buy = np.where(short, deficits, 0.0)
+    own = np.where(short, 0.0, -deficits)
+    costs = buy @ buy_price - own @ sell_own
+    # Marginal cost of one more lb required: bought when short, not sold otherwise
+    duals = np.where(short, buy_price, sell_own)
+    return costs, duals, buy, own
+
+
+def _check_status(highs: highspy.Highs) -> None:
+    status = highs.getModelStatus()
+    if status != highspy.HighsModelStatus.kOptimal:
+        raise RuntimeError(f"Optimization failed with status: {highs.modelStatusToString(status)}")
+
+
+def solve_l_shaped(
+    materials_cost: np.ndarray,
+    requirement: np.ndarray,
+    buy_price: np.ndarray,
+    sell_own: np.ndarray,
+    prob: np.ndarray,
+    yield_coef: np.ndarray,
+    total_land: float,
+    tol: float = 1e-7,
+    max_iterations: int = 200,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+    """
+    Run the L-shaped method until the master lower bound meets the evaluated cost.
+
+    Args:
+        yield_coef: [S, C] lbs produced per acre of crop c in scenario s
+
+    Returns:
+        (acres [C], vendor purchases [S, C], own-store sales [S, C], minimum expected cost)
+    """
+    n_crops = yield_coef.shape[1]
+    crop_index = np.arange(n_crops, dtype=np.int32)
+
+    # Master columns: [acres_1..C, θ_1..C]; rows: land limit, then C cuts per iteration
+    master = highspy.Highs()
+    master.setOptionValue('output_flag', False)
+    inf = highspy.kHighsInf
+    master.addCols(
+        2 * n_crops,
+        np.concatenate([materials_cost, np.ones(n_crops)]),
+        np.concatenate([np.zeros(n_crops), np.full(n_crops, -inf)]),
+        np.full(2 * n_crops, inf),
+        0, np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.int32), np.zeros(0),
+    )
+    master.addRow(-inf, total_land, n_crops, crop_index, np.ones(n_crops))
+    # Cut row c has two entries, acres_c and θ_c
+    cut_starts = 2 * crop_index
+    cut_index = np.column_stack([crop_index, n_crops + crop_index]).ravel()
+    cut_lower = np.full(n_crops, -inf)
+
+    # Any acres vector gives valid cuts, so start from an empty field
+    acres = np.zeros(n_crops)
+    lower_bound = -np.inf
+
+    for _ in range(max_iterations):
+        costs, duals, buy, own = solve_recourse(requirement - yield_coef * acres, buy_price, sell_own)
+
+        upper_bound = float(materials_cost @ acres + prob @ costs)
+        if upper_bound - lower_bound <= tol * max(1.0, abs(upper_bound)):
+            return acres, buy, own, upper_bound
+
+        # Recourse separates by crop once acres are fixed, so each crop gets
+        # its own cut θ_c >= h_c - g_c acres_c, written as -g_c acres_c - θ_c <= -h_c
+        weighted = prob[:, None] * duals
+        g = (weighted * yield_coef).sum(axis=0)
+        h = weighted.sum(axis=0) * requirement
+        cut_values = np.column_stack([-g, -np.ones(n_crops)]).ravel()
+        master.addRows(n_crops, cut_lower, -h, 2 * n_crops, cut_starts, cut_index, cut_values)
+
+        master.run()
+        _check_status(master)
+        acres = np.array(master.getSolution().col_value[:n_crops])
+        lower_bound = master.getInfo().objective_function_value
+
+    raise RuntimeError(f"Benders decomposition did not converge in {max_iterations} iterations")
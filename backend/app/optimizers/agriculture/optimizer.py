@@ -7,42 +7,130 @@ Stage 2:  After weather scenario unfolds:
           - S_ij: Sell surplus at own store
 
 Prices and plants_per_acre are now per-crop.
+
+Three solve backends share the same data preparation and result extraction:
+- "matrix" (default): assembles the LP as a sparse matrix and solves it with
+  HiGHS through highspy, without creating any PuLP objects; supports warm
+  starts from a previous basis
+- "benders": L-shaped decomposition with the scenario subproblems solved in
+  closed form (see benders.py); suited to large scenario counts
+- "pulp": builds the model symbolically through PuLP and solves it with
+  default_solver() (PuLP's in-process HiGHS interface)
 """
 
-from typing import Dict, Any
-from pulp import LpVariable, lpSum
-from ..base import BaseOptimizer
+import os
+import re
+from itertools import chain
+from typing import Dict, Any, Optional, Tuple, Union
+import highspy
+import numpy as np
+from pydantic import BaseModel
+from scipy import sparse
+from pulp import LpVariable, LpAffineExpression, LpConstraint, LpConstraintGE, lpSum
+from ..base import BaseOptimizer, HighsPool, suspend_gc
+from .benders import solve_l_shaped
+
+
+# Compact PuLP names for per-(crop, scenario) variables and rows
+_COMPACT_NAME = re.compile(r'^(b|o|sd)(\d+)_(\d+)$')
+_COMPACT_PREFIXES = {'b': 'buy', 'o': 'own', 'sd': 'supply_demand'}
 
 
 class AgricultureOptimizer(BaseOptimizer):
 
-    def __init__(self, input_data: Dict[str, Any]):
+    BACKENDS = ('matrix', 'benders', 'pulp')
+
+    def __init__(
+        self,
+        input_data: Union[Dict[str, Any], BaseModel],
+        backend: str = 'matrix',
+        persistent_solver: Optional[HighsPool] = None,
+    ):
+        """
+        Args:
+            input_data: Problem parameters as a dictionary or an AgricultureInput
+            backend: One of BACKENDS
+            persistent_solver: Shared HiGHS sessions for the "matrix" backend;
+                a session's last optimal basis is reused when its previous
+                model had the same number of crops and scenarios
+        """
         super().__init__(input_data)
 
-        farm = input_data['farm_resources']
-        self.total_land = farm['total_land']
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}', expected one of {self.BACKENDS}")
+        self.backend = backend
+        self.persistent_solver = persistent_solver
+        self._solution = None
+        self._basis = None
 
-        self.crops = input_data['crops']
-        self.crop_names = [c['name'] for c in self.crops]
-        self.crop_data = {c['name']: c for c in self.crops}
+        field = self._field
+        self.total_land = field(field(input_data, 'farm_resources'), 'total_land')
+
+        self.crops = field(input_data, 'crops')
+        self.crop_names = [field(c, 'name') for c in self.crops]
+        self.crop_data = dict(zip(self.crop_names, self.crops))
+
+        self._all_scenarios = self.scenarios
+
+    def _scenario_yield_mult(self, scenarios) -> np.ndarray:
+        return np.array(
+            [[1.0 + self._field(s, 'yield_changes').get(c, 0.0) for c in self.crop_names]
+             for s in scenarios],
+            dtype=np.float64,
+        ).reshape(len(scenarios), len(self.crop_names))
+
+    def prepare_data(self) -> None:
+        """
+        Cache a structure-of-arrays view of the crop and scenario parameters,
+        indexed [crop] or [scenario, crop] in crop_names / scenarios order.
+        """
+        # Zero-probability scenarios add variables and rows but nothing to the
+        # objective, so they are left out of the model. Pruning happens after
+        # validation so the full input list is what gets checked; recourse for
+        # the pruned scenarios is filled in after the solve (see
+        # _with_pruned_scenarios).
+        kept = self._probabilities > 0
+        self.scenarios = [s for s, keep in zip(self._all_scenarios, kept) if keep]
+
+        def crop_vec(field: str) -> np.ndarray:
+            return np.array([self._field(c, field) for c in self.crops], dtype=np.float64)
+
+        self._plants = crop_vec('plants_per_acre')
+        self._base_yield = crop_vec('base_yield_per_plant')
+        self._requirement = crop_vec('requirement')
+        self._materials_cost = crop_vec('materials_cost_per_acre')
+        self._sell_price = crop_vec('selling_price')
+        self._sell_own = crop_vec('selling_price_own_store')
+        self._buy_price = crop_vec('purchase_price_per_lb')
+        self._prob = self._probabilities[kept]
+        self._yield_mult = self._scenario_yield_mult(self.scenarios)
+        # lbs per acre of crop c in scenario s: the acres coefficient of every supply row
+        self._yield_coef = self._plants * self._base_yield * self._yield_mult
+        # Contracted buyer revenue is fixed: the objective constant
+        self._buyer_revenue = float(self._sell_price @ self._requirement)
 
     def define_stage1_variables(self) -> None:
-        self.variables['acres'] = {
-            crop: LpVariable(f"acres_{crop}", lowBound=0)
-            for crop in self.crop_names
-        }
+        with suspend_gc():
+            self.variables['acres'] = LpVariable.dicts("acres", self.crop_names, lowBound=0)
 
     def define_stage2_variables(self) -> None:
-        self.variables['vendor_purchase'] = {
-            (crop, s['name']): LpVariable(f"buy_{crop}_{s['name']}", lowBound=0)
-            for crop in self.crop_names
-            for s in self.scenarios
-        }
-        self.variables['own_store_sales'] = {
-            (crop, s['name']): LpVariable(f"own_{crop}_{s['name']}", lowBound=0)
-            for crop in self.crop_names
-            for s in self.scenarios
-        }
+        # Compact index-based names ("b<crop>_<scenario>"); readable_name()
+        # maps them back to crop and scenario names when debugging the model
+        scenario_names = [self._field(s, 'name') for s in self.scenarios]
+        keys = [
+            (crop, s_name, f"{i}_{j}")
+            for i, crop in enumerate(self.crop_names)
+            for j, s_name in enumerate(scenario_names)
+        ]
+        with suspend_gc():
+            self.variables['vendor_purchase'] = {
+                (crop, s_name): LpVariable("b" + suffix, lowBound=0)
+                for crop, s_name, suffix in keys
+            }
+            self.variables['own_store_sales'] = {
+                (crop, s_name): LpVariable("o" + suffix, lowBound=0)
+                for crop, s_name, suffix in keys
+            }
 
     def define_constraints(self) -> None:
         # 1. Total land constraint
@@ -52,31 +140,44 @@ class AgricultureOptimizer(BaseOptimizer):
         )
 
         # 2. Supply >= requirement per crop, per scenario
-        for crop in self.crop_names:
-            info = self.crop_data[crop]
-            base_yield = info['base_yield_per_plant']
-            plants_per_acre = info['plants_per_acre']
-            requirement = info['requirement']
-
-            for scenario in self.scenarios:
-                s_name = scenario['name']
-                yield_change = scenario['yield_changes'].get(crop, 0.0)
-                yield_multiplier = 1.0 + yield_change
-
-                realized_yield = (
-                    self.variables['acres'][crop]
-                    * plants_per_acre
-                    * base_yield
-                    * yield_multiplier
+        #    Rows are built directly as LpConstraint with a numeric rhs, which
+        #    skips the intermediate expressions created by the `*`, `+`, `>=`
+        #    operator overloads.
+        acres = self.variables['acres']
+        vendor_purchase = self.variables['vendor_purchase']
+        own_store_sales = self.variables['own_store_sales']
+
+        yield_coef = self._yield_coef.tolist()
+
+        for i, crop in enumerate(self.crop_names):
+            requirement = self._requirement[i]
+
+            for j, scenario in enumerate(self.scenarios):
+                s_name = self._field(scenario, 'name')
+
+                realized_yield = LpAffineExpression([
+                    (acres[crop], yield_coef[j][i]),
+                    (vendor_purchase[(crop, s_name)], 1),
+                    (own_store_sales[(crop, s_name)], -1),
+                ])
+
+                self.problem += LpConstraint(
+                    realized_yield,
+                    sense=LpConstraintGE,
+                    name=f"sd{i}_{j}",
+                    rhs=requirement,
                 )
 
-                self.problem += (
-                    realized_yield
-                    + self.variables['vendor_purchase'][(crop, s_name)]
-                    - self.variables['own_store_sales'][(crop, s_name)]
-                    >= requirement,
-                    f"supply_demand_{crop}_{s_name}"
-                )
+    def readable_name(self, name: str) -> str:
+        """Expand a compact stage 2 variable or constraint name, e.g. "b0_2" -> "buy_<crop>_<scenario>"."""
+        match = _COMPACT_NAME.match(name)
+        if match is None:
+            return name
+        prefix, i, j = match.groups()
+        return (
+            f"{_COMPACT_PREFIXES[prefix]}_{self.crop_names[int(i)]}"
+            f"_{self._field(self.scenarios[int(j)], 'name')}"
+        )
 
     def define_objective(self) -> None:
         """
@@ -85,115 +186,334 @@ class AgricultureOptimizer(BaseOptimizer):
           Variable: E[ sum_i(selling_price_own_store_i * S_ij) ]
           Cost:     sum_i(materials_cost_i * acres_i) + E[sum_i(purchase_price_i * P_ij)]
         """
-        buyer_revenue = sum(
-            self.crop_data[c]['selling_price'] * self.crop_data[c]['requirement']
-            for c in self.crop_names
-        )
+        buyer_revenue = self._buyer_revenue
 
-        planting_cost = lpSum(
-            self.crop_data[c]['materials_cost_per_acre'] * self.variables['acres'][c]
-            for c in self.crop_names
-        )
+        acres = self.variables['acres']
+        own_store_sales = self.variables['own_store_sales']
+        vendor_purchase = self.variables['vendor_purchase']
 
-        expected_own_store = lpSum(
-            scenario['probability']
-            * self.crop_data[c]['selling_price_own_store']
-            * self.variables['own_store_sales'][(c, scenario['name'])]
-            for c in self.crop_names
-            for scenario in self.scenarios
+        # Single (var, coef) pass instead of summing several lpSum expressions
+        planting_cost = (
+            (acres[c], -self._materials_cost[i])
+            for i, c in enumerate(self.crop_names)
         )
-
-        expected_vendor_cost = lpSum(
-            scenario['probability']
-            * self.crop_data[c]['purchase_price_per_lb']
-            * self.variables['vendor_purchase'][(c, scenario['name'])]
-            for c in self.crop_names
-            for scenario in self.scenarios
+        expected_own_store = (
+            (own_store_sales[(c, self._field(scenario, 'name'))],
+             self._prob[j] * self._sell_own[i])
+            for i, c in enumerate(self.crop_names)
+            for j, scenario in enumerate(self.scenarios)
+        )
+        expected_vendor_cost = (
+            (vendor_purchase[(c, self._field(scenario, 'name'))],
+             -self._prob[j] * self._buy_price[i])
+            for i, c in enumerate(self.crop_names)
+            for j, scenario in enumerate(self.scenarios)
         )
 
         self.problem += (
-            buyer_revenue + expected_own_store - planting_cost - expected_vendor_cost,
+            LpAffineExpression(
+                chain(planting_cost, expected_own_store, expected_vendor_cost),
+                constant=buyer_revenue,
+            ),
             "maximize_expected_profit"
         )
 
-    def extract_results(self) -> None:
-        planting_plan = {
-            c: self.get_variable_value(self.variables['acres'][c])
-            for c in self.crop_names
-        }
-        total_land_used = sum(planting_plan.values())
+    @property
+    def basis(self) -> Optional[highspy.HighsBasis]:
+        """Optimal basis of the last "matrix" solve, or None."""
+        return self._basis
+
+    def solve(self, warm_start_from: Any = None) -> Dict[str, Any]:
+        """
+        Main optimization workflow.
+
+        Args:
+            warm_start_from: Starting basis for the "matrix" backend: a solved
+                AgricultureOptimizer, a highspy.HighsBasis, or the path of a
+                file written by save_basis(). Bases from a model with a
+                different crop/scenario count are ignored, as is the argument
+                for the other backends.
+
+        Returns:
+            Dictionary containing optimization results
+        """
+        if self.backend == 'pulp':
+            return super().solve()
+
+        self.validate_input()
+        self.prepare_data()
+        if self.backend == 'benders':
+            self._solve_benders()
+        else:
+            self._solve_matrix(warm_start_from)
+        self.extract_results()
+
+        return self.results
+
+    def save_basis(self, path: str) -> None:
+        """Write the optimal basis of the last "matrix" solve to a HiGHS basis file."""
+        if self._basis is None:
+            raise RuntimeError("No basis available: solve with the matrix backend first")
+        highs = highspy.Highs()
+        highs.setOptionValue('output_flag', False)
+        highs.passModel(self._highs_lp(*self._build_matrix()))
+        highs.setBasis(self._basis)
+        highs.writeBasis(os.fspath(path))
+
+    def _cost_vector(self) -> np.ndarray:
+        # Maximizing profit == minimizing its negation (constant dropped)
+        return np.concatenate([
+            self._materials_cost,
+            np.outer(self._prob, self._buy_price).ravel(),
+            -np.outer(self._prob, self._sell_own).ravel(),
+        ])
+
+    def _row_upper(self) -> np.ndarray:
+        return np.concatenate([[self.total_land], -np.tile(self._requirement, len(self.scenarios))])
+
+    def _acres_coefficients(self) -> np.ndarray:
+        """[S, C] coefficient of acres_i in supply row (s, i), in "<=" form."""
+        return -self._yield_coef
+
+    def _build_matrix(self) -> Tuple[np.ndarray, sparse.csr_matrix, np.ndarray]:
+        """
+        Assemble the LP as: minimize c @ x s.t. A_ub @ x <= b_ub, x >= 0.
 
-        buyer_revenue = sum(
-            self.crop_data[c]['selling_price'] * self.crop_data[c]['requirement']
-            for c in self.crop_names
+        Column order is [acres_i, buy_(s,i), own_(s,i)], scenario-major within
+        each stage 2 block, so buy_(s,i) sits at C + s*C + i and own_(s,i) at
+        C + C*S + s*C + i. Row 0 is the land limit and row 1 + s*C + i is the
+        supply-demand row for crop i in scenario s, negated to "<=" form.
+        """
+        n_crops, n_scen = len(self.crop_names), len(self.scenarios)
+        n_pairs = n_crops * n_scen
+        n_cols = n_crops + 2 * n_pairs
+
+        # COO triplets sized to the exact nonzero count: C land entries, then
+        # 3 per supply row k = s*C + i (acres_i, buy_k, own_k)
+        nnz = n_crops + 3 * n_pairs
+        rows = np.empty(nnz, dtype=np.int32)
+        cols = np.empty(nnz, dtype=np.int32)
+        data = np.empty(nnz, dtype=np.float64)
+
+        rows[:n_crops] = 0
+        cols[:n_crops] = np.arange(n_crops)
+        data[:n_crops] = 1.0
+
+        k = np.arange(n_pairs, dtype=np.int32)
+        acres_part = slice(n_crops, n_crops + n_pairs)
+        buy_part = slice(n_crops + n_pairs, n_crops + 2 * n_pairs)
+        own_part = slice(n_crops + 2 * n_pairs, nnz)
+        rows[acres_part] = rows[buy_part] = rows[own_part] = 1 + k
+        cols[acres_part] = k % n_crops
+        cols[buy_part] = n_crops + k
+        cols[own_part] = n_crops + n_pairs + k
+        data[acres_part] = self._acres_coefficients().ravel()
+        data[buy_part] = -1.0
+        data[own_part] = 1.0
+
+        A_ub = sparse.coo_matrix((data, (rows, cols)), shape=(1 + n_pairs, n_cols)).tocsr()
+        return self._cost_vector(), A_ub, self._row_upper()
+
+    @staticmethod
+    def _highs_lp(c: np.ndarray, A_ub: sparse.csr_matrix, b_ub: np.ndarray) -> highspy.HighsLp:
+        """Wrap the linprog-form arrays as a HiGHS LP (row-wise constraint matrix)."""
+        n_rows, n_cols = A_ub.shape
+        lp = highspy.HighsLp()
+        lp.num_col_ = n_cols
+        lp.num_row_ = n_rows
+        lp.col_cost_ = c
+        lp.col_lower_ = np.zeros(n_cols)
+        lp.col_upper_ = np.full(n_cols, highspy.kHighsInf)
+        lp.row_lower_ = np.full(n_rows, -highspy.kHighsInf)
+        lp.row_upper_ = b_ub
+        lp.a_matrix_.format_ = highspy.MatrixFormat.kRowwise
+        lp.a_matrix_.num_col_ = n_cols
+        lp.a_matrix_.num_row_ = n_rows
+        lp.a_matrix_.start_ = A_ub.indptr
+        lp.a_matrix_.index_ = A_ub.indices
+        lp.a_matrix_.value_ = A_ub.data
+        return lp
+
+    @staticmethod
+    def _apply_warm_start(highs: highspy.Highs, warm_start_from: Any) -> None:
+        if isinstance(warm_start_from, (str, os.PathLike)):
+            if highs.readBasis(os.fspath(warm_start_from)) != highspy.HighsStatus.kOk:
+                raise ValueError(f"Could not read basis file: {warm_start_from}")
+            return
+
+        if isinstance(warm_start_from, AgricultureOptimizer):
+            warm_start_from = warm_start_from.basis
+        if warm_start_from is None or not warm_start_from.valid:
+            return
+        if (len(warm_start_from.col_status) == highs.getNumCol()
+                and len(warm_start_from.row_status) == highs.getNumRow()):
+            highs.setBasis(warm_start_from)
+
+    def _solve_matrix(self, warm_start_from: Any = None) -> None:
+        if self.persistent_solver is None:
+            highs = highspy.Highs()
+            highs.setOptionValue('output_flag', False)
+            highs.passModel(self._highs_lp(*self._build_matrix()))
+            self._run_highs(highs, warm_start_from)
+            return
+
+        # Same crop/scenario counts => same rows and columns, so the basis left
+        # by a previous request is a valid starting point
+        key = (self.__class__.__name__, len(self.crop_names), len(self.scenarios))
+        with self.persistent_solver.session(key) as session:
+            session.load(key, self._highs_lp(*self._build_matrix()))
+            self._run_highs(session.highs, warm_start_from)
+            session.record_basis()
+
+    def _run_highs(self, highs: highspy.Highs, warm_start_from: Any) -> None:
+        self._apply_warm_start(highs, warm_start_from)
+        highs.run()
+
+        status = highs.getModelStatus()
+        if status != highspy.HighsModelStatus.kOptimal:
+            raise RuntimeError(f"Optimization failed with status: {highs.modelStatusToString(status)}")
+
+        self._basis = highs.getBasis()
+
+        n_crops, n_scen = len(self.crop_names), len(self.scenarios)
+        n_pairs = n_crops * n_scen
+        x = np.array(highs.getSolution().col_value)
+        self._solution = (
+            x[:n_crops],
+            x[n_crops:n_crops + n_pairs].reshape(n_scen, n_crops),
+            x[n_crops + n_pairs:].reshape(n_scen, n_crops),
+            self._buyer_revenue - highs.getInfo().objective_function_value,
         )
 
-        planting_cost = sum(
-            self.crop_data[c]['materials_cost_per_acre'] * planting_plan[c]
-            for c in self.crop_names
+    def _solve_benders(self) -> None:
+        acres, buy, own, cost = solve_l_shaped(
+            materials_cost=self._materials_cost,
+            requirement=self._requirement,
+            buy_price=self._buy_price,
+            sell_own=self._sell_own,
+            prob=self._prob,
+            yield_coef=self._yield_coef,
+            total_land=self.total_land,
+        )
+        self._solution = (acres, buy, own, self._buyer_revenue - cost)
+
+    def _solution_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+        """(acres [C], vendor_purchase [S, C], own_store_sales [S, C], objective) of the solved model."""
+        if self._solution is not None:
+            return self._solution
+
+        acres = self.variables['acres']
+        planting_vec = np.fromiter(
+            (self.get_variable_value(acres[c]) for c in self.crop_names),
+            dtype=np.float64,
+            count=len(self.crop_names),
+        )
+        return (
+            planting_vec,
+            self._scenario_values('vendor_purchase'),
+            self._scenario_values('own_store_sales'),
+            self.get_variable_value(self.problem.objective),
         )
 
-        scenario_results = []
-        scenario_profits = []
+    def _scenario_values(self, key: str) -> np.ndarray:
+        """Solved values of a (crop, scenario) variable family as an [S, C] array."""
+        family = self.variables[key]
+        n_crops, n_scen = len(self.crop_names), len(self.scenarios)
+        return np.fromiter(
+            (self.get_variable_value(family[(c, self._field(s, 'name'))])
+             for s in self.scenarios
+             for c in self.crop_names),
+            dtype=np.float64,
+            count=n_crops * n_scen,
+        ).reshape(n_scen, n_crops)
+
+    def _with_pruned_scenarios(
+        self,
+        planting_vec: np.ndarray,
+        buy: np.ndarray,
+        own: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Expand solved [S, C] recourse arrays to every input scenario.
 
-        for scenario in self.scenarios:
-            s_name = scenario['name']
-            prob = scenario['probability']
+        Scenarios pruned for zero probability were not in the model; for them
+        the cheapest recourse given the planting plan is reported: buy any
+        shortfall from the vendor, sell any surplus at the own store.
 
-            vendor_purchases = {
-                c: self.get_variable_value(self.variables['vendor_purchase'][(c, s_name)])
-                for c in self.crop_names
-            }
-            own_store_sales = {
-                c: self.get_variable_value(self.variables['own_store_sales'][(c, s_name)])
-                for c in self.crop_names
-            }
+        Returns:
+            (vendor purchases, own-store sales, yield coefficients, probabilities),
+            all in input scenario order
+        """
+        yield_coef = self._plants * self._base_yield * self._scenario_yield_mult(self._all_scenarios)
+        deficit = self._requirement - planting_vec * yield_coef
+        full_buy = np.maximum(deficit, 0.0)
+        full_own = np.maximum(-deficit, 0.0)
 
-            yield_realized = {}
-            for c in self.crop_names:
-                info = self.crop_data[c]
-                yc = scenario['yield_changes'].get(c, 0.0)
-                yield_realized[c] = (
-                    planting_plan[c]
-                    * info['plants_per_acre']
-                    * info['base_yield_per_plant']
-                    * (1.0 + yc)
-                )
+        prob = self._probabilities
+        full_buy[prob > 0] = buy
+        full_own[prob > 0] = own
+        return full_buy, full_own, yield_coef, prob
 
-            own_store_rev = sum(
-                self.crop_data[c]['selling_price_own_store'] * own_store_sales[c]
-                for c in self.crop_names
-            )
-            vendor_cost = sum(
-                self.crop_data[c]['purchase_price_per_lb'] * vendor_purchases[c]
-                for c in self.crop_names
-            )
+    def extract_results(self) -> None:
+        planting_vec, buy, own, objective_value = self._solution_arrays()
+        scenarios, yield_coef, prob = self.scenarios, self._yield_coef, self._prob
+        if len(scenarios) < len(self._all_scenarios):
+            buy, own, yield_coef, prob = self._with_pruned_scenarios(planting_vec, buy, own)
+            scenarios = self._all_scenarios
+        planting_plan = dict(zip(self.crop_names, planting_vec.tolist()))
+        total_land_used = sum(planting_plan.values())
 
-            profit = buyer_revenue + own_store_rev - planting_cost - vendor_cost
-            scenario_profits.append(profit)
-
-            scenario_results.append({
-                'scenario_name': s_name,
-                'probability': prob,
-                'yield_realized': yield_realized,
-                'vendor_purchases': vendor_purchases,
-                'own_store_sales': own_store_sales,
-                'own_store_revenue': own_store_rev,
-                'vendor_cost': vendor_cost,
+        buyer_revenue = self._buyer_revenue
+        planting_cost = float(planting_vec @ self._materials_cost)
+
+        # Per-scenario quantities as [S, C] arrays, then per-scenario totals
+        yield_matrix = planting_vec * yield_coef
+
+        own_store_rev = own @ self._sell_own
+        vendor_cost = buy @ self._buy_price
+        profits = buyer_revenue + own_store_rev - planting_cost - vendor_cost
+        scenario_profits = profits.tolist()
+
+        # Every per-crop dict has the same keys: copy a presized template and
+        # overwrite its values in place rather than growing a new dict each time
+        crop_template = dict.fromkeys(self.crop_names, 0.0)
+        crop_names = self.crop_names
+
+        def per_crop(values):
+            d = crop_template.copy()
+            d.update(zip(crop_names, values))
+            return d
+
+        scenario_results = [
+            {
+                'scenario_name': self._field(scenario, 'name'),
+                'probability': self._field(scenario, 'probability'),
+                'yield_realized': per_crop(y_row),
+                'vendor_purchases': per_crop(b_row),
+                'own_store_sales': per_crop(o_row),
+                'own_store_revenue': rev,
+                'vendor_cost': cost,
                 'profit': profit,
-            })
+            }
+            for scenario, y_row, b_row, o_row, rev, cost, profit in zip(
+                scenarios,
+                yield_matrix.tolist(),
+                buy.tolist(),
+                own.tolist(),
+                own_store_rev.tolist(),
+                vendor_cost.tolist(),
+                scenario_profits,
+            )
+        ]
 
         # Probability-weighted expected profit  Σ p_s * profit_s
-        expected_profit = sum(
-            sc['probability'] * sp
-            for sc, sp in zip(scenario_results, scenario_profits)
-        )
+        expected_profit = float(prob @ profits)
         risk = self.calculate_risk_metrics(scenario_profits)
         risk['expected_profit'] = expected_profit   # override simple mean with weighted mean
 
         self.results = {
             'status': 'optimal',
-            'objective_value': self.get_variable_value(self.problem.objective),
+            'objective_value': objective_value,
             'stage1_decisions': {
                 'planting_plan': planting_plan,
                 'total_land_used': total_land_used,
@@ -1,3 +1,4 @@
-from .optimizer import BaseOptimizer
+from .optimizer import BaseOptimizer, suspend_gc
+from .highs import HighsPool, PersistentHighs
 
-__all__ = ['BaseOptimizer']
+__all__ = ['BaseOptimizer', 'HighsPool', 'PersistentHighs', 'suspend_gc']
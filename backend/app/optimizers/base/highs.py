@@ -0,0 +1,93 @@
+"""
+Long-lived HiGHS solver instances shared across optimizations.
+
+Consecutive requests often have the same structure (same crops and
+scenarios, different prices or yields). PersistentHighs remembers the
+optimal basis of the last model it solved; when the next model has the same
+structural key, HiGHS starts from that basis instead of from scratch.
+HighsPool hands sessions out to concurrent solves, one solve per session.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Hashable, Iterator, List, Optional
+import highspy
+
+
+class PersistentHighs:
+    """
+    A highspy.Highs instance plus the structural key and optimal basis of
+    the last model solved in it.
+
+    The instance is not safe for concurrent solves; take it from a HighsPool,
+    which gives each solve its own session.
+    """
+
+    def __init__(self):
+        self.highs = highspy.Highs()
+        self.highs.setOptionValue('output_flag', False)
+        self.key: Optional[Hashable] = None
+        self.basis: Optional[highspy.HighsBasis] = None
+
+    def load(self, key: Hashable, lp: highspy.HighsLp) -> bool:
+        """
+        Pass a freshly built model, starting from the last basis if the shape matches.
+
+        The model is always passed whole: building it from arrays is cheaper
+        than patching costs, bounds and coefficients one call at a time, so
+        the basis is the only state carried over.
+
+        Args:
+            key: Structural identity of the model (same key => same rows and columns)
+            lp: The full LP
+
+        Returns:
+            True if the previous basis was applied
+        """
+        self.highs.passModel(lp)
+        reused = key == self.key and self.basis is not None
+        if reused:
+            self.highs.setBasis(self.basis)
+        self.key = key
+        self.basis = None
+        return reused
+
+    def record_basis(self) -> None:
+        """Keep the optimal basis of the model just solved for the next load()."""
+        self.basis = self.highs.getBasis()
+
+
+class HighsPool:
+    """
+    Free PersistentHighs sessions, handed out one solve at a time.
+
+    A session is created whenever all existing ones are busy, so the pool
+    grows to the peak number of concurrent solves (bounded by the API's
+    solve slots) and never makes solves wait for each other.
+    """
+
+    def __init__(self):
+        self._free: List[PersistentHighs] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def session(self, key: Hashable) -> Iterator[PersistentHighs]:
+        """
+        Borrow a session for one solve, preferring one whose last model had `key`.
+
+        Args:
+            key: Structural identity of the model about to be solved
+        """
+        with self._lock:
+            matching = [i for i, s in enumerate(self._free) if s.key == key]
+            if matching:
+                session = self._free.pop(matching[-1])
+            elif self._free:
+                session = self._free.pop()
+            else:
+                session = PersistentHighs()
+        try:
+            yield session
+        finally:
+            with self._lock:
+                self._free.append(session)
@@ -6,12 +6,93 @@ Each sector (Agriculture, Manufacturing, Pharma, Food) extends this base class
 and implements its own decision variables, constraints, and objectives.
 """
 
+import gc
+import operator
+import threading
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
-from pulp import LpProblem, LpMaximize, LpVariable, lpSum, LpStatus, value
+from contextlib import contextmanager
+from typing import Dict, List, Any, Optional, Tuple, Union
+from numba import njit
+from pydantic import BaseModel
+from pulp import (
+    HiGHS, LpProblem, LpMaximize, LpVariable, lpSum, LpStatus, LpStatusOptimal, value,
+)
 import numpy as np
 
 
+# Collector state shared by overlapping suspend_gc() blocks; gc.disable()
+# is process-wide, so solves running on threadpool threads must agree on
+# when the outermost block ends
+_gc_lock = threading.Lock()
+_gc_suspensions = 0
+_gc_was_enabled = False
+
+
+@contextmanager
+def suspend_gc():
+    """
+    Temporarily disable the cyclic garbage collector.
+
+    Model building allocates many small PuLP objects in a row; with the
+    collector enabled each allocation burst triggers generation scans that
+    find nothing to free. Blocks may overlap across threads: the collector
+    is disabled by the first one to enter and its previous state restored
+    when the last one exits.
+    """
+    global _gc_suspensions, _gc_was_enabled
+    with _gc_lock:
+        if _gc_suspensions == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_suspensions += 1
+    try:
+        yield
+    finally:
+        with _gc_lock:
+            _gc_suspensions -= 1
+            if _gc_suspensions == 0 and _gc_was_enabled:
+                gc.enable()
+
+
+# Wall-clock limit for a single PuLP solve, in seconds
+SOLVER_TIME_LIMIT = 30
+
+
+def default_solver():
+    """
+    PuLP solver used by BaseOptimizer.solve.
+    
+    PuLP's in-process HiGHS interface hands the model to highspy in memory
+    instead of writing an MPS file for an external binary. highspy is a hard
+    dependency of the optimizers package, so no other solver is tried.
+    """
+    return HiGHS(msg=False, timeLimit=SOLVER_TIME_LIMIT, output_flag=False)
+
+
+@njit(cache=True)
+def _profit_moments(profits: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    Mean, population standard deviation, min and max in a single pass.
+
+    Uses Welford's update for the variance to stay accurate when profits
+    are large relative to their spread.
+    """
+    mean = 0.0
+    m2 = 0.0
+    lo = profits[0]
+    hi = profits[0]
+    for k in range(profits.shape[0]):
+        x = profits[k]
+        delta = x - mean
+        mean += delta / (k + 1)
+        m2 += delta * (x - mean)
+        if x < lo:
+            lo = x
+        elif x > hi:
+            hi = x
+    return mean, np.sqrt(m2 / profits.shape[0]), lo, hi
+
+
 class BaseOptimizer(ABC):
     """
     Abstract base class for two-stage stochastic optimization.
@@ -26,17 +107,24 @@ class BaseOptimizer(ABC):
     Where: profit_s = revenue_s - cost_s
     """
     
-    def __init__(self, input_data: Dict[str, Any]):
+    def __init__(self, input_data: Union[Dict[str, Any], BaseModel]):
         """
         Initialize optimizer with input data.
         
         Args:
-            input_data: Dictionary containing all problem parameters
+            input_data: All problem parameters, either as a dictionary or as the
+                validated Pydantic request model (read by attribute, not copied)
         """
         self.input_data = input_data
+        # Field accessors for input records: _field(obj, name) for required
+        # fields, _field_or(obj, name, default) for optional ones
+        if isinstance(input_data, BaseModel):
+            self._field, self._field_or = getattr, getattr
+        else:
+            self._field, self._field_or = operator.getitem, dict.get
         self.problem = LpProblem(f"{self.__class__.__name__}_Optimization", LpMaximize)
         self.variables = {}
-        self.scenarios = input_data.get('scenarios', [])
+        self.scenarios = self._field_or(input_data, 'scenarios', [])
         self.results = {}
         
     @abstractmethod
@@ -105,19 +193,37 @@ class BaseOptimizer(ABC):
         if not self.scenarios:
             raise ValueError("At least one scenario must be defined")
         
+        # Read all probabilities in one pass, then check them with array reductions.
+        # The array is kept (input scenario order) so subclasses need not re-read it.
+        self._probabilities = probs = np.fromiter(
+            (self._field_or(s, 'probability', 0) for s in self.scenarios),
+            dtype=np.float64,
+            count=len(self.scenarios),
+        )
+        
         # Check probabilities sum to 1
-        total_prob = sum(s.get('probability', 0) for s in self.scenarios)
+        total_prob = float(probs.sum())
         if not np.isclose(total_prob, 1.0, atol=1e-6):
             raise ValueError(f"Scenario probabilities must sum to 1.0, got {total_prob}")
         
         # Check all probabilities are non-negative
-        for i, scenario in enumerate(self.scenarios):
-            prob = scenario.get('probability', 0)
-            if prob < 0:
-                raise ValueError(f"Scenario {i} has negative probability: {prob}")
+        negative = np.flatnonzero(probs < 0)
+        if negative.size:
+            i = int(negative[0])
+            raise ValueError(f"Scenario {i} has negative probability: {float(probs[i])}")
         
         return True
     
+    def prepare_data(self) -> None:
+        """
+        Precompute derived parameters once validation has passed.
+        
+        Called before the model is built. Subclasses override this to cache
+        lookups (e.g. NumPy arrays of per-scenario coefficients) shared by
+        the constraint, objective and result-extraction steps.
+        """
+        pass
+    
     def solve(self) -> Dict[str, Any]:
         """
         Main optimization workflow.
@@ -127,6 +233,7 @@ class BaseOptimizer(ABC):
         """
         # Step 1: Validate input
         self.validate_input()
+        self.prepare_data()
         
         # Step 2: Build optimization model
         self.define_stage1_variables()
@@ -135,12 +242,11 @@ class BaseOptimizer(ABC):
         self.define_objective()
         
         # Step 3: Solve
-        self.problem.solve()
+        self.problem.solve(default_solver())
         
-        # Step 4: Check solution status
-        status = LpStatus[self.problem.status]
-        if status != 'Optimal':
-            raise RuntimeError(f"Optimization failed with status: {status}")
+        # Step 4: Check solution status (name lookup only needed on failure)
+        if self.problem.status != LpStatusOptimal:
+            raise RuntimeError(f"Optimization failed with status: {LpStatus[self.problem.status]}")
         
         # Step 5: Extract results
         self.extract_results()
@@ -172,14 +278,18 @@ class BaseOptimizer(ABC):
         Returns:
             Dictionary of risk metrics
         """
-        scenario_profits = np.array(scenario_profits)
+        scenario_profits = np.asarray(scenario_profits, dtype=np.float64)
+        if scenario_profits.size == 0:
+            raise ValueError("At least one scenario profit is required")
+        
+        mean, std, min_profit, max_profit = _profit_moments(scenario_profits)
         
         return {
-            'expected_profit': float(np.mean(scenario_profits)),
-            'std_deviation': float(np.std(scenario_profits)),
-            'min_profit': float(np.min(scenario_profits)),
-            'max_profit': float(np.max(scenario_profits)),
-            'profit_range': float(np.max(scenario_profits) - np.min(scenario_profits)),
+            'expected_profit': float(mean),
+            'std_deviation': float(std),
+            'min_profit': float(min_profit),
+            'max_profit': float(max_profit),
+            'profit_range': float(max_profit - min_profit),
         }
     
     def get_variable_value(self, variable) -> float:
@@ -5,8 +5,9 @@ Prices and plants_per_acre are now per-crop.
 """
 
 from pydantic import BaseModel, Field, field_validator
+from pydantic.dataclasses import dataclass
 from typing import List, Dict
-from .common import Scenario
+from .common import RECORD_CONFIG, Scenario
 
 
 class FarmResources(BaseModel):
@@ -14,7 +15,8 @@ class FarmResources(BaseModel):
     total_land: float = Field(..., gt=0, description="Total available land in acres")
 
 
-class Crop(BaseModel):
+@dataclass(frozen=True, slots=True, config=RECORD_CONFIG)
+class Crop:
     """Individual crop (berry variety) configuration."""
     name: str = Field(..., description="Crop name (e.g., 'Mohawk')")
     base_yield_per_plant: float = Field(..., gt=0, description="Base yield in lbs per plant")
@@ -26,6 +28,7 @@ class Crop(BaseModel):
     selling_price_own_store: float = Field(..., ge=0, description="Selling price at own store for surplus ($/lb)")
 
 
+@dataclass(frozen=True, slots=True, config=RECORD_CONFIG)
 class AgricultureScenario(Scenario):
     """Weather scenario for agriculture."""
     yield_changes: Dict[str, float] = Field(
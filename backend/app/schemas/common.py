@@ -2,11 +2,19 @@
 Common Pydantic schemas used across all modules.
 """
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic.dataclasses import dataclass
 from typing import List, Dict, Optional
 
 
-class Scenario(BaseModel):
+# Per-record request models (one instance per crop / scenario) are slotted,
+# frozen pydantic dataclasses: same validation and OpenAPI schema as a
+# BaseModel, without a per-instance __dict__
+RECORD_CONFIG = ConfigDict(extra='forbid')
+
+
+@dataclass(frozen=True, slots=True, config=RECORD_CONFIG)
+class Scenario:
     """Base scenario model."""
     name: str = Field(..., description="Scenario name")
     probability: float = Field(..., ge=0, le=1, description="Scenario probability (0-1)")
@@ -27,6 +35,9 @@ class OptimizationResponse(BaseModel):
     stage2_decisions: List[Dict]
     financial_summary: Dict
     risk_metrics: Dict
+    solution_id: Optional[str] = Field(
+        None, description="Pass as warm_start_id to warm-start a similar follow-up request"
+    )
 
 
 class ErrorResponse(BaseModel):
@@ -3,9 +3,14 @@ Unit tests for Agriculture Optimizer
 """
 
 import pytest
+import gc
 import json
+import threading
+import numpy as np
 from pathlib import Path
 from app.optimizers.agriculture import AgricultureOptimizer
+from app.optimizers.base import HighsPool, suspend_gc
+from app.schemas.agriculture import AgricultureInput
 
 
 def load_example_data():
@@ -15,6 +20,71 @@ def load_example_data():
         return json.load(f)
 
 
+def make_input_data():
+    """Build a small agriculture input matching the current API schema."""
+    return {
+        'farm_resources': {'total_land': 100},
+        'crops': [
+            {
+                'name': 'Mohawk',
+                'base_yield_per_plant': 2.0,
+                'plants_per_acre': 1000,
+                'materials_cost_per_acre': 400,
+                'purchase_price_per_lb': 2.5,
+                'requirement': 90000,
+                'selling_price': 2.0,
+                'selling_price_own_store': 1.2,
+            },
+            {
+                'name': 'Chickasaw',
+                'base_yield_per_plant': 1.5,
+                'plants_per_acre': 1200,
+                'materials_cost_per_acre': 350,
+                'purchase_price_per_lb': 3.0,
+                'requirement': 60000,
+                'selling_price': 2.5,
+                'selling_price_own_store': 1.5,
+            },
+        ],
+        'scenarios': [
+            {'name': 'Drought', 'probability': 0.3,
+             'yield_changes': {'Mohawk': -0.3, 'Chickasaw': -0.2}},
+            {'name': 'Normal', 'probability': 0.5,
+             'yield_changes': {'Mohawk': 0.0, 'Chickasaw': 0.0}},
+            {'name': 'Ideal', 'probability': 0.2,
+             'yield_changes': {'Mohawk': 0.2, 'Chickasaw': 0.15}},
+        ],
+    }
+
+
+def make_scaled_input_data(n_crops, n_scen, seed=0):
+    """Build a random agriculture input with the given crop and scenario counts."""
+    rng = np.random.default_rng(seed)
+    crop_names = [f'Crop{i}' for i in range(n_crops)]
+    probabilities = rng.dirichlet(np.ones(n_scen))
+    return {
+        'farm_resources': {'total_land': 300},
+        'crops': [
+            {
+                'name': name,
+                'base_yield_per_plant': float(rng.uniform(1.0, 3.0)),
+                'plants_per_acre': 1000,
+                'materials_cost_per_acre': float(rng.uniform(300, 500)),
+                'purchase_price_per_lb': float(rng.uniform(2.5, 3.5)),
+                'requirement': float(rng.uniform(20000, 90000)),
+                'selling_price': 2.0,
+                'selling_price_own_store': float(rng.uniform(1.0, 1.5)),
+            }
+            for name in crop_names
+        ],
+        'scenarios': [
+            {'name': f'Scenario{j}', 'probability': float(probabilities[j]),
+             'yield_changes': {name: float(rng.uniform(-0.4, 0.3)) for name in crop_names}}
+            for j in range(n_scen)
+        ],
+    }
+
+
 class TestAgricultureOptimizer:
     """Test suite for AgricultureOptimizer."""
     
@@ -117,6 +187,167 @@ class TestAgricultureOptimizer:
         # Min should be <= Max
         assert risk_metrics['min_profit'] <= risk_metrics['max_profit']
 
+    def test_matrix_backend_matches_pulp(self):
+        """Test that the sparse-matrix backend reproduces the PuLP model."""
+        matrix = AgricultureOptimizer(make_input_data()).solve()
+        pulp = AgricultureOptimizer(make_input_data(), backend='pulp').solve()
+        
+        assert matrix['objective_value'] == pytest.approx(pulp['objective_value'])
+        assert matrix['financial_summary']['expected_profit'] == pytest.approx(
+            pulp['financial_summary']['expected_profit']
+        )
+        assert matrix['objective_value'] == pytest.approx(
+            matrix['financial_summary']['expected_profit']
+        )
+    
+    def test_benders_backend_matches_matrix(self):
+        """Test that the L-shaped decomposition converges to the monolithic optimum."""
+        matrix = AgricultureOptimizer(make_input_data()).solve()
+        benders = AgricultureOptimizer(make_input_data(), backend='benders').solve()
+        
+        assert benders['objective_value'] == pytest.approx(matrix['objective_value'], rel=1e-6)
+        for crop, acres in matrix['stage1_decisions']['planting_plan'].items():
+            assert benders['stage1_decisions']['planting_plan'][crop] == pytest.approx(acres, abs=1e-4)
+    
+    def test_benders_converges_with_many_crops(self):
+        """Test that per-crop cuts reach the monolithic optimum on a larger model."""
+        data = make_scaled_input_data(n_crops=40, n_scen=300)
+        matrix = AgricultureOptimizer(data).solve()
+        benders = AgricultureOptimizer(data, backend='benders').solve()
+        
+        assert benders['objective_value'] == pytest.approx(matrix['objective_value'], rel=1e-6)
+        for crop, acres in matrix['stage1_decisions']['planting_plan'].items():
+            assert benders['stage1_decisions']['planting_plan'][crop] == pytest.approx(acres, abs=1e-2)
+    
+    def test_warm_start_reuses_basis(self, tmp_path):
+        """Test that a warm-started re-solve reaches the same optimum."""
+        first = AgricultureOptimizer(make_input_data())
+        first.solve()
+        
+        data = make_input_data()
+        for crop in data['crops']:
+            crop['purchase_price_per_lb'] *= 1.05
+        cold = AgricultureOptimizer(data).solve()
+        warm = AgricultureOptimizer(data).solve(warm_start_from=first)
+        
+        assert warm['objective_value'] == pytest.approx(cold['objective_value'])
+        
+        basis_file = tmp_path / 'agriculture.bas'
+        first.save_basis(basis_file)
+        from_file = AgricultureOptimizer(data).solve(warm_start_from=basis_file)
+        
+        assert from_file['objective_value'] == pytest.approx(cold['objective_value'])
+    
+    def test_persistent_solver_matches_fresh_solve(self):
+        """Test that re-solving from a shared session's basis gives the same optimum as a fresh solve."""
+        pool = HighsPool()
+        key = ('AgricultureOptimizer', 2, 3)
+        
+        for price_factor in (1.0, 1.1, 0.9):
+            data = make_input_data()
+            for crop in data['crops']:
+                crop['selling_price_own_store'] *= price_factor
+                crop['requirement'] *= price_factor
+            
+            fresh = AgricultureOptimizer(data).solve()
+            reused = AgricultureOptimizer(data, persistent_solver=pool).solve()
+            with pool.session(key) as session:
+                assert session.basis is not None and session.basis.valid
+            
+            assert reused['objective_value'] == pytest.approx(fresh['objective_value'])
+            assert reused['stage1_decisions']['planting_plan'] == pytest.approx(
+                fresh['stage1_decisions']['planting_plan']
+            )
+    
+    def test_persistent_solver_does_not_serialize_solves(self):
+        """Test that a solve proceeds on a new session while another solve holds one."""
+        pool = HighsPool()
+        key = ('AgricultureOptimizer', 2, 3)
+        AgricultureOptimizer(make_input_data(), persistent_solver=pool).solve()
+        
+        with pool.session(key) as busy:
+            results = AgricultureOptimizer(make_input_data(), persistent_solver=pool).solve()
+            with pool.session(key) as other:
+                assert other is not busy
+        
+        fresh = AgricultureOptimizer(make_input_data()).solve()
+        assert results['objective_value'] == pytest.approx(fresh['objective_value'])
+    
+    def test_zero_probability_scenarios_pruned_but_reported(self):
+        """Test that zero-probability scenarios stay out of the model but appear in results."""
+        data = make_input_data()
+        data['scenarios'].append({
+            'name': 'Hailstorm', 'probability': 0.0,
+            'yield_changes': {'Mohawk': -0.8, 'Chickasaw': -0.8},
+        })
+        baseline = AgricultureOptimizer(make_input_data()).solve()
+        optimizer = AgricultureOptimizer(data)
+        results = optimizer.solve()
+        
+        assert len(optimizer.scenarios) == 3
+        assert [s['scenario_name'] for s in results['stage2_decisions']][-1] == 'Hailstorm'
+        assert results['objective_value'] == pytest.approx(baseline['objective_value'])
+        
+        hailstorm = results['stage2_decisions'][-1]
+        assert sum(hailstorm['vendor_purchases'].values()) > 0
+        assert results['risk_metrics']['min_profit'] == pytest.approx(hailstorm['profit'])
+    
+    @pytest.mark.parametrize('probabilities, message', [
+        ([0.0, 0.0, 0.0], 'must sum to 1.0, got 0.0'),
+        ([-0.2, 0.7, 0.5], 'Scenario 0 has negative probability'),
+        ([-0.2, 0.5, 0.5], 'must sum to 1.0'),
+    ])
+    def test_probability_errors_unaffected_by_pruning(self, probabilities, message):
+        """Test that validation sees every input scenario, in the original check order."""
+        data = make_input_data()
+        for scenario, probability in zip(data['scenarios'], probabilities):
+            scenario['probability'] = probability
+        
+        with pytest.raises(ValueError, match=message):
+            AgricultureOptimizer(data).solve()
+    
+    def test_accepts_validated_pydantic_model(self):
+        """Test that the optimizer reads an AgricultureInput without model_dump()."""
+        from_dict = AgricultureOptimizer(make_input_data()).solve()
+        from_model = AgricultureOptimizer(AgricultureInput(**make_input_data())).solve()
+        
+        assert from_model == from_dict
+    
+    def test_overlapping_gc_suspensions_restore_collector(self):
+        """Test that interleaved suspend_gc blocks on two threads keep the collector off until both exit."""
+        assert gc.isenabled()
+        first_entered = threading.Event()
+        second_entered = threading.Event()
+        first_exited = threading.Event()
+        enabled_inside_second = []
+        
+        def first():
+            with suspend_gc():
+                first_entered.set()
+                second_entered.wait(5)
+            first_exited.set()
+        
+        def second():
+            first_entered.wait(5)
+            with suspend_gc():
+                second_entered.set()
+                first_exited.wait(5)
+                enabled_inside_second.append(gc.isenabled())
+        
+        threads = [threading.Thread(target=first), threading.Thread(target=second)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        
+        assert enabled_inside_second == [False]
+        assert gc.isenabled()
+    
+    def test_unknown_backend_raises_error(self):
+        """Test that an unsupported backend name is rejected."""
+        with pytest.raises(ValueError):
+            AgricultureOptimizer(make_input_data(), backend='gurobi')
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -67,4 +67,5 @@ export interface AgricultureResult {
     max_profit: number;
     profit_range: number;
   };
+  solution_id?: string | null;
 }